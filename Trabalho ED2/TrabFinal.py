@@ -8,6 +8,9 @@ import random    # Usado para embaralhar listas (busca sequencial) e escolher it
 import heapq     # Essencial para a fila de prioridade (min-heap) usada na construção da árvore de Huffman.
 import math      # Necessário para as operações matemáticas nas funções de hash (raiz quadrada e parte fracionária).
 import sys       # Usado no Módulo 2 para medir o tamanho de objetos em memória (embora a medição final tenha sido em bits).
+import hashlib   # Gera as impressões digitais (hash do conteúdo) que versionam o cache de resultados.
+import bisect    # Busca binária em C usada nos caminhos de inserção/remoção do catálogo mutável.
+from collections import OrderedDict # Mantém a ordem de uso das entradas no cache de resultados (LRU/LFU).
 
 # ==============================================================================
 # SEÇÃO DE DADOS 
@@ -179,6 +182,476 @@ def rabin_karp(texto, padrao, base=256, modulo=103):
                 hash_texto += modulo
     return ocorrencias, comp_hash, comp_char
 
+def _bisect_contado(chaves, alvo, esquerda=0, direita=None):
+    """
+    Versão de bisect_left que também conta as comparações realizadas,
+    no mesmo espírito da busca_binaria.
+    """
+    direita = len(chaves) if direita is None else direita
+    num_comparacoes = 0
+    while esquerda < direita:
+        meio = (esquerda + direita) // 2
+        num_comparacoes += 1
+        if chaves[meio] < alvo:
+            esquerda = meio + 1
+        else:
+            direita = meio
+    return esquerda, num_comparacoes
+
+class CatalogoOrdenado:
+    """
+    Catálogo ordenado e MUTÁVEL, implementado como uma lista de blocos ordenados.
+    Em vez de uma única lista (onde list.insert desloca até n elementos), os IDs ficam
+    em blocos de tamanho limitado: localizar o bloco é uma busca binária sobre os
+    maiores IDs de cada bloco, e inserir/remover desloca no máximo um bloco.
+    """
+    def __init__(self, fragmentos=None, tamanho_bloco=1000):
+        if tamanho_bloco < 2:
+            raise ValueError("O tamanho do bloco deve ser pelo menos 2.")
+        self.tamanho_bloco = tamanho_bloco
+        # Listas paralelas: _chaves[b] guarda os IDs do bloco b e _itens[b] os fragmentos.
+        # _maximos[b] é o maior ID do bloco b, usado para escolher o bloco por busca binária.
+        self._chaves, self._itens, self._maximos = [], [], []
+        self._tamanho = 0
+        # Contador de versões: muda a cada inserção, atualização ou remoção, para que
+        # quem guarda resultados do catálogo (ex.: BuscasComCache) saiba que ele mudou.
+        self.versao = 0
+        # Árvore de Fenwick (árvore binária indexada) com o tamanho de cada bloco: dá a posição
+        # global do início de um bloco em O(log b) e é atualizada em O(log b) a cada inserção
+        # ou remoção, sem percorrer todos os blocos.
+        self._fenwick = [0]
+        if fragmentos:
+            ordenados = sorted(fragmentos, key=lambda f: f['id']) # O(n) se já vierem ordenados.
+            # IDs repetidos: fica apenas o último registro de cada ID, como no inserir.
+            # O sorted é estável, então o último da entrada também é o último do grupo.
+            ordenados = [f for i, f in enumerate(ordenados)
+                         if i + 1 == len(ordenados) or ordenados[i + 1]['id'] != f['id']]
+            for i in range(0, len(ordenados), tamanho_bloco):
+                bloco = ordenados[i:i + tamanho_bloco]
+                self._itens.append(bloco)
+                self._chaves.append([f['id'] for f in bloco])
+                self._maximos.append(bloco[-1]['id'])
+            self._tamanho = len(ordenados)
+            self._reconstruir_fenwick()
+
+    def __len__(self):
+        return self._tamanho
+
+    def __iter__(self):
+        for bloco in self._itens:
+            yield from bloco
+
+    def _localizar_bloco(self, id_alvo):
+        """Índice do primeiro bloco cujo maior ID é >= id_alvo (ou o último bloco)."""
+        b = bisect.bisect_left(self._maximos, id_alvo)
+        return min(b, len(self._maximos) - 1)
+
+    def _reconstruir_fenwick(self):
+        """Monta a árvore de Fenwick em O(b); usado apenas quando blocos são criados ou removidos."""
+        arvore = [0] * (len(self._chaves) + 1)
+        for i, bloco in enumerate(self._chaves, 1):
+            arvore[i] += len(bloco)
+            pai = i + (i & -i)
+            if pai < len(arvore):
+                arvore[pai] += arvore[i]
+        self._fenwick = arvore
+
+    def _ajustar_tamanho_bloco(self, b, delta):
+        """Soma delta ao tamanho do bloco b na árvore de Fenwick."""
+        arvore, i = self._fenwick, b + 1
+        while i < len(arvore):
+            arvore[i] += delta
+            i += i & -i
+
+    def _inicio_do_bloco(self, b):
+        """Posição global do primeiro elemento do bloco b (soma dos tamanhos dos blocos anteriores)."""
+        arvore, i, total = self._fenwick, b, 0
+        while i > 0:
+            total += arvore[i]
+            i -= i & -i
+        return total
+
+    def inserir(self, fragmento):
+        """Insere um fragmento mantendo a ordem por 'id' (atualiza se o ID já existir)."""
+        id_novo = fragmento['id']
+        if not self._chaves:
+            self._chaves.append([id_novo])
+            self._itens.append([fragmento])
+            self._maximos.append(id_novo)
+            self._tamanho = 1
+            self.versao += 1
+            self._reconstruir_fenwick()
+            return
+        b = self._localizar_bloco(id_novo)
+        chaves, itens = self._chaves[b], self._itens[b]
+        pos = bisect.bisect_left(chaves, id_novo)
+        if pos < len(chaves) and chaves[pos] == id_novo:
+            itens[pos] = fragmento # ID já catalogado: apenas atualiza o registro.
+            self.versao += 1
+            return
+        chaves.insert(pos, id_novo) # Desloca no máximo um bloco, não o catálogo inteiro.
+        itens.insert(pos, fragmento)
+        self._maximos[b] = chaves[-1]
+        self._tamanho += 1
+        self.versao += 1
+        # Bloco cheio demais: divide ao meio para manter o custo de inserção limitado.
+        if len(chaves) > 2 * self.tamanho_bloco:
+            meio = len(chaves) // 2
+            self._chaves[b:b + 1] = [chaves[:meio], chaves[meio:]]
+            self._itens[b:b + 1] = [itens[:meio], itens[meio:]]
+            self._maximos[b:b + 1] = [chaves[meio - 1], chaves[-1]]
+            # Os índices dos blocos seguintes mudaram: remonta a árvore (no máximo uma vez
+            # a cada tamanho_bloco inserções no bloco, então o custo amortizado é pequeno).
+            self._reconstruir_fenwick()
+        else:
+            self._ajustar_tamanho_bloco(b, 1)
+
+    def remover(self, id_alvo):
+        """Remove o fragmento com o ID informado. Retorna o fragmento removido ou None."""
+        if not self._chaves:
+            return None
+        b = self._localizar_bloco(id_alvo)
+        chaves, itens = self._chaves[b], self._itens[b]
+        pos = bisect.bisect_left(chaves, id_alvo)
+        if pos == len(chaves) or chaves[pos] != id_alvo:
+            return None
+        del chaves[pos]
+        fragmento = itens.pop(pos)
+        self._tamanho -= 1
+        self.versao += 1
+        if chaves:
+            self._maximos[b] = chaves[-1]
+            self._ajustar_tamanho_bloco(b, -1)
+        else:
+            # Bloco esvaziou: remove-o para não deixar "buracos" na busca dos blocos.
+            del self._chaves[b], self._itens[b], self._maximos[b]
+            self._reconstruir_fenwick()
+        return fragmento
+
+    def buscar(self, id_alvo):
+        """
+        Busca um ID com o mesmo contrato da busca_binaria:
+        retorna (posição global, número de comparações) ou (None, comparações).
+        """
+        if not self._chaves:
+            return None, 0
+        b, comp_blocos = _bisect_contado(self._maximos, id_alvo)
+        if b == len(self._maximos):
+            return None, comp_blocos # Maior que todos os IDs do catálogo.
+        chaves = self._chaves[b]
+        pos, comp_bloco = _bisect_contado(chaves, id_alvo)
+        num_comparacoes = comp_blocos + comp_bloco + 1 # +1 pela verificação de igualdade.
+        if pos < len(chaves) and chaves[pos] == id_alvo:
+            return self._inicio_do_bloco(b) + pos, num_comparacoes
+        return None, num_comparacoes
+
+    def obter(self, id_alvo):
+        """Retorna o fragmento com o ID informado, ou None."""
+        if not self._chaves:
+            return None
+        b = self._localizar_bloco(id_alvo)
+        pos = bisect.bisect_left(self._chaves[b], id_alvo)
+        if pos < len(self._chaves[b]) and self._chaves[b][pos] == id_alvo:
+            return self._itens[b][pos]
+        return None
+
+    def intervalo(self, id_inicio, id_fim=None):
+        """
+        Gera, em ordem, os fragmentos com id_inicio <= id < id_fim (sem limite se id_fim for None).
+        É um gerador: os resultados são produzidos sob demanda, sem montar uma lista.
+        """
+        if not self._chaves:
+            return
+        b = bisect.bisect_left(self._maximos, id_inicio)
+        pos = bisect.bisect_left(self._chaves[b], id_inicio) if b < len(self._chaves) else 0
+        while b < len(self._chaves):
+            chaves, itens = self._chaves[b], self._itens[b]
+            # Bloco inteiro dentro do intervalo: entrega sem comparar ID a ID.
+            if id_fim is None or self._maximos[b] < id_fim:
+                yield from itens[pos:]
+            else:
+                fim = bisect.bisect_left(chaves, id_fim, pos)
+                yield from itens[pos:fim]
+                return
+            b, pos = b + 1, 0
+
+    def prefixo(self, prefixo):
+        """Gera, em ordem, os fragmentos cujo ID começa com o prefixo informado."""
+        if not prefixo:
+            yield from self
+            return
+        # Todo ID com o prefixo é < que o prefixo com o último caractere incrementado.
+        limite = prefixo[:-1] + chr(ord(prefixo[-1]) + 1)
+        yield from self.intervalo(prefixo, limite)
+
+def _tamanho_aproximado(obj):
+    """Estima, em bytes, o espaço ocupado por um resultado (percorre listas, tuplas e dicionários)."""
+    tamanho = sys.getsizeof(obj)
+    if isinstance(obj, (list, tuple)):
+        tamanho += sum(_tamanho_aproximado(item) for item in obj)
+    elif isinstance(obj, dict):
+        tamanho += sum(_tamanho_aproximado(k) + _tamanho_aproximado(v) for k, v in obj.items())
+    return tamanho
+
+def versao_conteudo(*partes):
+    """Gera uma "impressão digital" (hash) do conteúdo, usada como versão no cache."""
+    h = hashlib.blake2b(digest_size=16)
+    for parte in partes:
+        h.update(parte.encode('utf-8'))
+        h.update(b'\x00') # Separador: evita que ("ab", "c") e ("a", "bc") tenham a mesma versão.
+    return h.hexdigest()
+
+class CacheResultados:
+    """
+    Cache limitado de resultados, com política de remoção LRU (menos recentemente usado)
+    ou LFU (menos frequentemente usado). O limite pode ser em número de entradas,
+    em bytes (estimados) ou ambos. Os valores são devolvidos como foram guardados,
+    então devem ser imutáveis (tuplas, strings, números).
+    """
+    def __init__(self, max_entradas=1024, max_bytes=None, politica='lru'):
+        if politica not in ('lru', 'lfu'):
+            raise ValueError("A política do cache deve ser 'lru' ou 'lfu'.")
+        if max_entradas is None and max_bytes is None:
+            raise ValueError("Informe um limite em entradas, em bytes ou ambos.")
+        if (max_entradas is not None and max_entradas <= 0) or (max_bytes is not None and max_bytes <= 0):
+            raise ValueError("Os limites do cache devem ser positivos.")
+        self.max_entradas, self.max_bytes, self.politica = max_entradas, max_bytes, politica
+        self._dados = {} # chave -> (valor, tamanho em bytes)
+        self.bytes_usados = 0
+        # LRU: uma única fila, do menos ao mais recentemente usado.
+        # LFU: uma fila por frequência; empates são desfeitos pelo uso mais antigo.
+        self._ordem = OrderedDict()
+        self._frequencia, self._por_frequencia, self._freq_minima = {}, {}, 0
+        self.acertos, self.falhas, self.remocoes, self.invalidacoes = 0, 0, 0, 0
+
+    def __len__(self):
+        return len(self._dados)
+
+    def __contains__(self, chave):
+        return chave in self._dados
+
+    def _registrar_uso(self, chave):
+        """Atualiza a posição da chave na política de remoção após um acesso."""
+        if self.politica == 'lru':
+            self._ordem.move_to_end(chave)
+            return
+        freq = self._frequencia[chave]
+        fila = self._por_frequencia[freq]
+        del fila[chave]
+        if not fila:
+            del self._por_frequencia[freq]
+            if self._freq_minima == freq:
+                self._freq_minima = freq + 1
+        self._frequencia[chave] = freq + 1
+        self._por_frequencia.setdefault(freq + 1, OrderedDict())[chave] = None
+
+    def _descartar(self, chave):
+        """Remove a chave do armazenamento e das estruturas da política."""
+        _, tamanho = self._dados.pop(chave)
+        self.bytes_usados -= tamanho
+        if self.politica == 'lru':
+            del self._ordem[chave]
+            return
+        freq = self._frequencia.pop(chave)
+        fila = self._por_frequencia[freq]
+        del fila[chave]
+        if not fila:
+            del self._por_frequencia[freq]
+            if self._freq_minima == freq:
+                self._freq_minima = min(self._por_frequencia, default=0)
+
+    def _vitima(self):
+        """Escolhe a próxima chave a ser removida conforme a política."""
+        if self.politica == 'lru':
+            return next(iter(self._ordem))
+        return next(iter(self._por_frequencia[self._freq_minima]))
+
+    def _excede_limites(self, tamanho_novo):
+        """Indica se uma nova entrada de tamanho_novo bytes ultrapassaria algum limite."""
+        return ((self.max_entradas is not None and len(self._dados) + 1 > self.max_entradas) or
+                (self.max_bytes is not None and self.bytes_usados + tamanho_novo > self.max_bytes))
+
+    def obter(self, chave, padrao=None, contar=True):
+        """Retorna o valor em cache ou o valor padrão (contando acerto/falha, se contar=True)."""
+        if chave in self._dados:
+            self.acertos += contar
+            self._registrar_uso(chave)
+            return self._dados[chave][0]
+        self.falhas += contar
+        return padrao
+
+    def guardar(self, chave, valor):
+        """Armazena um resultado, removendo entradas antigas se os limites forem ultrapassados."""
+        tamanho = _tamanho_aproximado(chave) + _tamanho_aproximado(valor)
+        if self.max_bytes is not None and tamanho > self.max_bytes:
+            return # Maior que o cache inteiro: não vale a pena guardar.
+        if chave in self._dados:
+            self._descartar(chave)
+        # Libera espaço ANTES de inserir, para que a entrada nova (frequência 1 no LFU)
+        # não seja escolhida como vítima de si mesma.
+        while self._dados and self._excede_limites(tamanho):
+            self._descartar(self._vitima())
+            self.remocoes += 1
+        self._dados[chave] = (valor, tamanho)
+        self.bytes_usados += tamanho
+        if self.politica == 'lru':
+            self._ordem[chave] = None
+        else:
+            self._frequencia[chave] = 1
+            self._por_frequencia.setdefault(1, OrderedDict())[chave] = None
+            self._freq_minima = 1
+
+    def obter_ou_calcular(self, chave, calcular):
+        """Retorna o resultado em cache ou chama calcular() e guarda o resultado."""
+        if chave in self._dados:
+            return self.obter(chave)
+        self.falhas += 1
+        valor = calcular()
+        self.guardar(chave, valor)
+        return valor
+
+    def descartar(self, chave):
+        """Remove uma única chave (se estiver no cache), contando como invalidação."""
+        if chave not in self._dados:
+            return False
+        self._descartar(chave)
+        self.invalidacoes += 1
+        return True
+
+    def invalidar(self, condicao=None):
+        """Remove as entradas cujas chaves satisfazem a condição (ou todas, se não houver condição)."""
+        chaves = [c for c in self._dados if condicao is None or condicao(c)]
+        for chave in chaves:
+            self._descartar(chave)
+        self.invalidacoes += len(chaves)
+        return len(chaves)
+
+    def estatisticas(self):
+        """Resume os contadores do cache para ajudar a dimensioná-lo."""
+        consultas = self.acertos + self.falhas
+        return {
+            'politica': self.politica,
+            'entradas': len(self._dados),
+            'bytes_usados': self.bytes_usados,
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'taxa_acerto': self.acertos / consultas if consultas else 0.0,
+            'remocoes': self.remocoes,
+            'invalidacoes': self.invalidacoes,
+        }
+
+class BuscasComCache:
+    """
+    Coloca um CacheResultados na frente da busca_binaria e do rabin_karp.
+    As chaves do cache incluem a versão do catálogo e do texto (hash do conteúdo):
+
+    - Com um CatalogoOrdenado, a versão é o contador que inserir/remover incrementam,
+      então alterações no catálogo nunca devolvem um resultado antigo.
+    - Com uma lista comum, a versão é o hash dos IDs, calculado ao criar o objeto.
+      Uma lista alterada no lugar não tem como ser percebida: depois de alterá-la,
+      chame atualizar_catalogo.
+    """
+    def __init__(self, catalogo_ordenado, cache=None):
+        self.cache = cache if cache is not None else CacheResultados()
+        self.catalogo_ordenado = catalogo_ordenado
+        self.versao_catalogo = self._versao_catalogo(catalogo_ordenado)
+        # Chaves de busca_binaria guardadas na versão atual do catálogo: quando a versão
+        # muda, só elas são descartadas (sem varrer o cache inteiro).
+        self._chaves_busca = set()
+
+    @staticmethod
+    def _versao_catalogo(catalogo_ordenado):
+        if isinstance(catalogo_ordenado, CatalogoOrdenado):
+            # id() distingue catálogos diferentes; o contador, as versões de um mesmo catálogo.
+            return (id(catalogo_ordenado), catalogo_ordenado.versao)
+        # A busca binária depende apenas dos IDs, então só eles entram na versão.
+        return versao_conteudo(*(fragmento['id'] for fragmento in catalogo_ordenado))
+
+    def _sincronizar_versao(self):
+        """Atualiza a versão do catálogo e descarta os resultados da versão anterior, se ela mudou."""
+        if isinstance(self.catalogo_ordenado, CatalogoOrdenado):
+            nova_versao = self._versao_catalogo(self.catalogo_ordenado)
+            if nova_versao != self.versao_catalogo:
+                self._trocar_versao(nova_versao)
+        return self.versao_catalogo
+
+    def _trocar_versao(self, nova_versao):
+        for chave in self._chaves_busca:
+            self.cache.descartar(chave)
+        self._chaves_busca.clear()
+        self.versao_catalogo = nova_versao
+
+    def _versao_texto(self, texto):
+        # A versão de cada texto também fica no cache (sem contar nas estatísticas), para não
+        # recalcular o hash a cada consulta. Como a chave guarda o texto inteiro, ele entra
+        # em bytes_usados e obedece aos mesmos limites e à mesma política de remoção.
+        chave = ('versao_texto', texto)
+        versao = self.cache.obter(chave, contar=False)
+        if versao is None:
+            versao = versao_conteudo(texto)
+            self.cache.guardar(chave, versao)
+        return versao
+
+    def atualizar_catalogo(self, catalogo_ordenado):
+        """
+        Troca o catálogo (ou avisa que uma lista comum foi alterada no lugar); se a versão
+        mudou, invalida os resultados da versão anterior. Para uma lista comum, recalcula
+        o hash de todos os IDs (O(n)); um CatalogoOrdenado dispensa esta chamada.
+        """
+        nova_versao = self._versao_catalogo(catalogo_ordenado)
+        self.catalogo_ordenado = catalogo_ordenado
+        if nova_versao != self.versao_catalogo:
+            self._trocar_versao(nova_versao)
+
+    def invalidar_texto(self, texto):
+        """
+        Descarta os resultados do rabin_karp calculados para um texto que deixou de ser usado,
+        junto com a versão memorizada dele. Retorna quantas entradas foram descartadas
+        (o mesmo número somado a cache.invalidacoes).
+        """
+        versao = self._versao_texto(texto)
+        removidas = self.cache.invalidar(lambda chave: chave[0] == 'rabin_karp' and chave[1] == versao)
+        return removidas + self.cache.descartar(('versao_texto', texto))
+
+    def busca_binaria(self, id_alvo):
+        """Mesmo contrato da busca_binaria: (índice, número de comparações)."""
+        chave = ('busca_binaria', self._sincronizar_versao(), id_alvo)
+        if chave not in self.cache:
+            self._chaves_busca.add(chave)
+            if len(self._chaves_busca) > 2 * max(len(self.cache), 1024):
+                # Esquece as chaves que o cache já removeu por conta própria.
+                self._chaves_busca = {c for c in self._chaves_busca if c in self.cache}
+        if isinstance(self.catalogo_ordenado, CatalogoOrdenado):
+            return self.cache.obter_ou_calcular(chave, lambda: self.catalogo_ordenado.buscar(id_alvo))
+        return self.cache.obter_ou_calcular(chave, lambda: busca_binaria(self.catalogo_ordenado, id_alvo))
+
+    def rabin_karp(self, texto, padrao, base=256, modulo=103):
+        """Mesmo contrato do rabin_karp: (ocorrências, comparações de hash, comparações de caracteres)."""
+        chave = self.chave_rabin_karp(texto, padrao, base, modulo)
+        # As ocorrências ficam guardadas como tupla e cada chamada recebe uma lista nova:
+        # quem alterar a lista devolvida não corrompe o resultado em cache.
+        ocorrencias, comp_hash, comp_char = self.cache.obter_ou_calcular(
+            chave, lambda: self._congelar(rabin_karp(texto, padrao, base, modulo)))
+        return list(ocorrencias), comp_hash, comp_char
+
+    # Para quem calcula o rabin_karp em outro lugar (ex.: o servidor, em um pool de processos)
+    # e usa o cache em duas etapas: consulta pela chave e, depois, guarda o resultado.
+
+    def chave_rabin_karp(self, texto, padrao, base=256, modulo=103):
+        """Chave do cache para rabin_karp(texto, padrao, base, modulo)."""
+        return ('rabin_karp', self._versao_texto(texto), padrao, base, modulo)
+
+    def guardar_rabin_karp(self, chave, resultado):
+        """Guarda um resultado calculado fora daqui; devolve a versão imutável que ficou no cache."""
+        congelado = self._congelar(resultado)
+        self.cache.guardar(chave, congelado)
+        return congelado
+
+    @staticmethod
+    def _congelar(resultado):
+        ocorrencias, comp_hash, comp_char = resultado
+        return tuple(ocorrencias), comp_hash, comp_char
+
 # --- Algoritmos do Módulo 2: Otimização e Hashing ---
 
 class HuffmanNode:
@@ -249,16 +722,88 @@ def descomprimir_huffman(compressed_text, tree_root):
             current_node = tree_root # Volta para a raiz para decodificar o próximo caractere.
     return decompressed_text
 
+class FiltroBloom:
+    """
+    Estrutura probabilística que responde "com certeza NÃO está" ou "talvez esteja".
+    Usa um vetor de bits e k funções de hash; nunca gera falso negativo, apenas
+    falsos positivos, com taxa controlada pelo tamanho do vetor.
+    """
+    def __init__(self, capacidade, taxa_falso_positivo=0.01):
+        if capacidade < 1:
+            raise ValueError("A capacidade do filtro deve ser pelo menos 1.")
+        if not 0 < taxa_falso_positivo < 1:
+            raise ValueError("A taxa de falso positivo deve estar entre 0 e 1.")
+        self.capacidade, self.taxa_falso_positivo = capacidade, taxa_falso_positivo
+        # Fórmulas clássicas: m = -n*ln(p) / (ln 2)^2 bits e k = (m/n)*ln 2 funções de hash.
+        self.num_bits = max(8, math.ceil(-capacidade * math.log(taxa_falso_positivo) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacidade * math.log(2)))
+        # Cada byte guarda 8 bits do filtro, o que mantém o custo de memória mínimo.
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.num_elementos = 0
+
+    @staticmethod
+    def _hashes_base(chave):
+        """
+        Deriva h1 e h2 do hash() nativo (já guardado em cache nas strings do Python), para a
+        técnica de hashing duplo (h1 + i*h2). O hash() muda entre execuções, mas o filtro
+        só vive dentro do processo, então não precisa ser estável.
+        """
+        h = hash(chave)
+        return h & 0xFFFFFFFF, ((h >> 32) & 0xFFFFFFFF) | 1 # h2 ímpar para não repetir posições.
+
+    def adicionar(self, chave):
+        """Marca no vetor os bits correspondentes à chave."""
+        h1, h2 = self._hashes_base(chave)
+        bits, m = self.bits, self.num_bits
+        pos = h1 % m
+        for _ in range(self.num_hashes):
+            bits[pos >> 3] |= 1 << (pos & 7)
+            pos = (pos + h2) % m
+        self.num_elementos += 1
+
+    def pode_conter(self, chave):
+        """Retorna False se a chave certamente não foi adicionada; True se talvez tenha sido."""
+        h = hash(chave)
+        bits, m = self.bits, self.num_bits
+        # Calcula as posições uma a uma (somando h2 à anterior): na maioria das ausências o
+        # primeiro ou o segundo bit já está zerado e as demais posições nem são calculadas.
+        pos = (h & 0xFFFFFFFF) % m
+        if not bits[pos >> 3] & (1 << (pos & 7)):
+            return False # Basta um bit zerado para garantir a ausência.
+        h2 = ((h >> 32) & 0xFFFFFFFF) | 1
+        for _ in range(self.num_hashes - 1):
+            pos = (pos + h2) % m
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def memoria_bytes(self):
+        """Custo de memória do vetor de bits, em bytes."""
+        return len(self.bits)
+
+    def taxa_falso_positivo_estimada(self):
+        """Estimativa teórica atual: (1 - e^(-k*n/m))^k."""
+        k, n, m = self.num_hashes, self.num_elementos, self.num_bits
+        return (1 - math.exp(-k * n / m)) ** k
+
 class CofreRapido:
     """Implementa uma Tabela Hash com tratamento de colisão por encadeamento."""
-    def __init__(self, tamanho, funcao_hash_nome):
+    def __init__(self, tamanho, funcao_hash_nome, usar_filtro=False, taxa_falso_positivo=0.01, capacidade_filtro=None, verboso=True):
         self.tamanho, self.funcao_hash_nome = tamanho, funcao_hash_nome
+        # Com verboso=False o cofre não imprime cada inserção (útil quando usado por um servidor).
+        self.verboso = verboso
         # A tabela é uma lista de listas. Cada lista interna representa uma "corrente"
         # para armazenar múltiplos itens que colidem no mesmo índice.
         self.tabela = [[] for _ in range(tamanho)]
         # A constante A (conjugado da razão áurea) é uma boa escolha para o método
         # da multiplicação, pois ajuda a espalhar bem as chaves.
         self.A = (math.sqrt(5) - 1) / 2
+        self.num_chaves = 0
+        # Filtro de Bloom opcional na frente da tabela: responde buscas por chaves
+        # inexistentes sem calcular o índice nem percorrer a corrente.
+        self.taxa_falso_positivo = taxa_falso_positivo
+        self.filtro = FiltroBloom(capacidade_filtro or tamanho, taxa_falso_positivo) if usar_filtro else None
+        self.consultas_filtro, self.negativas_filtro, self.falsos_positivos = 0, 0, 0
 
     def _str_para_int(self, chave):
         """Converte uma string em um inteiro para que possamos aplicar cálculos matemáticos."""
@@ -293,21 +838,72 @@ class CofreRapido:
         for par in self.tabela[indice]:
             if par[0] == chave:
                 par[1] = valor # Atualiza o valor existente.
-                print(f"  > Chave '{chave}' atualizada no índice {indice}.")
+                if self.verboso:
+                    print(f"  > Chave '{chave}' atualizada no índice {indice}.")
                 return
         # Se a chave não existe, adiciona o novo par à corrente (lista) do índice.
         self.tabela[indice].append([chave, valor])
-        print(f"  > Chave '{chave}' inserida no índice {indice}.")
+        self.num_chaves += 1
+        if self.filtro is not None:
+            # Se o filtro atingiu a capacidade, sua taxa de falso positivo degrada:
+            # reconstrói com o dobro do espaço antes de adicionar a nova chave.
+            if self.filtro.num_elementos >= self.filtro.capacidade:
+                self._reconstruir_filtro(self.filtro.capacidade * 2)
+            else:
+                self.filtro.adicionar(chave)
+        if self.verboso:
+            print(f"  > Chave '{chave}' inserida no índice {indice}.")
+
+    def _reconstruir_filtro(self, capacidade):
+        """Recria o Filtro de Bloom a partir de todas as chaves presentes na tabela."""
+        self.filtro = FiltroBloom(max(capacidade, self.num_chaves), self.taxa_falso_positivo)
+        for corrente in self.tabela:
+            for par in corrente:
+                self.filtro.adicionar(par[0])
+
+    def redimensionar(self, novo_tamanho):
+        """Redistribui todos os pares em uma tabela de novo tamanho (e reconstrói o filtro)."""
+        pares = [par for corrente in self.tabela for par in corrente]
+        self.tamanho = novo_tamanho
+        self.tabela = [[] for _ in range(novo_tamanho)]
+        # Os índices dependem do tamanho da tabela, então cada par precisa ser reposicionado.
+        for par in pares:
+            self.tabela[self._hash(par[0])].append(par)
+        if self.filtro is not None:
+            self._reconstruir_filtro(max(novo_tamanho, self.filtro.capacidade))
 
     def buscar(self, chave):
         """Busca um valor no cofre pela sua chave."""
+        if self.filtro is not None:
+            self.consultas_filtro += 1
+            if not self.filtro.pode_conter(chave):
+                self.negativas_filtro += 1
+                return None # Ausência garantida: nem calcula o índice na tabela.
         indice = self._hash(chave)
         # Percorre a pequena lista (corrente) no índice calculado.
         for par in self.tabela[indice]:
             if par[0] == chave:
                 return par[1] # Encontrou a chave, retorna o valor.
+        if self.filtro is not None:
+            self.falsos_positivos += 1 # O filtro disse "talvez", mas a chave não existe.
         return None # Se percorreu a corrente e não encontrou, retorna None.
 
+    def estatisticas_filtro(self):
+        """Resume a eficácia e o custo do Filtro de Bloom (ou None se ele estiver desativado)."""
+        if self.filtro is None:
+            return None
+        consultas = self.consultas_filtro
+        return {
+            'consultas': consultas,
+            'negativas_no_filtro': self.negativas_filtro,
+            'falsos_positivos': self.falsos_positivos,
+            'taxa_acerto_filtro': self.negativas_filtro / consultas if consultas else 0.0,
+            'taxa_fp_estimada': self.filtro.taxa_falso_positivo_estimada(),
+            'memoria_bytes': self.filtro.memoria_bytes(),
+            'num_bits': self.filtro.num_bits,
+            'num_hashes': self.filtro.num_hashes,
+        }
+
     def exibir_cofre(self):
         """Mostra a estrutura interna do cofre para visualizar a distribuição e as colisões."""
         print("\n--- Estrutura do Cofre Rápido ---")
@@ -365,6 +961,30 @@ def desafio_2_busca_binaria():
             print(f"  - FALHA! Fragmento '{fragmento_id}' não encontrado.")
     print("\nAnálise: Observe o número ridiculamente baixo de comparações da Busca Binária!")
 
+def desafio_2b_catalogo_mutavel():
+    """Simula e demonstra inserções, remoções e consultas por intervalo no catálogo ordenado."""
+    print("\n--- Desafio 2b: O Catálogo Vivo (Lista de Blocos Ordenados) ---")
+    # PREPARAÇÃO
+    catalogo = CatalogoOrdenado(gerar_catalogo_ordenado(1000000))
+    novos_ids = [f"ID_{i:07}A" for i in random.sample(range(1000000), 5)]
+    print(f"Inserindo {len(novos_ids)} novos fragmentos em um catálogo de {len(catalogo)} registros...")
+
+    # EXECUÇÃO E APRESENTAÇÃO
+    start_time = time.perf_counter()
+    for novo_id in novos_ids:
+        catalogo.inserir({'id': novo_id, 'titulo': f"Registro Recém-Descoberto {novo_id}", 'categoria': 'Achado Recente'})
+    tempo_execucao = (time.perf_counter() - start_time) * 1000
+    print(f"  - Inserções concluídas em {tempo_execucao:.4f} ms (sem reordenar o catálogo).")
+    for novo_id in novos_ids:
+        indice, comparacoes = catalogo.buscar(novo_id)
+        print(f"  - Fragmento '{novo_id}' na posição {indice} com {comparacoes} comparações.")
+
+    # Consultas que a lista estática não oferece: intervalo e prefixo.
+    no_intervalo = sum(1 for _ in catalogo.intervalo("ID_0500000", "ID_0500100"))
+    com_prefixo = [f['id'] for f in catalogo.prefixo(novos_ids[0][:-2])]
+    print(f"  - {no_intervalo} fragmentos entre 'ID_0500000' e 'ID_0500100'.")
+    print(f"  - IDs com prefixo '{novos_ids[0][:-2]}': {com_prefixo}")
+
 def desafio_3_rabin_karp():
     """Simula e demonstra o desafio do Rabin-Karp Matcher."""
     print("\n--- Desafio 3: Decifrando os Códigos do Vazio (Rabin-Karp Matcher) ---")
@@ -382,6 +1002,31 @@ def desafio_3_rabin_karp():
             else:
                 print(f"  - Marca '{marca}' NÃO encontrada.")
 
+def desafio_3b_cache_resultados():
+    """Simula consultas repetidas e demonstra o ganho do cache de resultados."""
+    print("\n--- Desafio 3b: A Memória do Arquivista (Cache LRU/LFU) ---")
+    # PREPARAÇÃO
+    catalogo, tomos = gerar_catalogo_ordenado(100000), carregar_tomos_antigos()
+    populares = [random.choice(catalogo)['id'] for _ in range(20)] # Poucos IDs muito procurados.
+    marcas = ["corrupção", "padrão", "Vazio"]
+
+    # EXECUÇÃO E APRESENTAÇÃO (uma rodada para cada política)
+    for politica in ['lru', 'lfu']:
+        buscas = BuscasComCache(catalogo, CacheResultados(max_entradas=16, politica=politica))
+        start_time = time.perf_counter()
+        for _ in range(2000):
+            buscas.busca_binaria(random.choice(populares))
+            buscas.rabin_karp(random.choice(list(tomos.values())), random.choice(marcas))
+        tempo_execucao = (time.perf_counter() - start_time) * 1000
+        stats = buscas.cache.estatisticas()
+        print(f"  - Política {politica.upper()}: {stats['acertos']} acertos, {stats['falhas']} falhas "
+              f"(taxa {stats['taxa_acerto']:.2%}), {stats['remocoes']} remoções, "
+              f"{stats['bytes_usados']} bytes em {tempo_execucao:.2f} ms.")
+
+    # Alterar o catálogo muda sua versão e invalida os resultados antigos.
+    buscas.atualizar_catalogo(catalogo[:50000])
+    print(f"  - Após encolher o catálogo: {buscas.cache.invalidacoes} resultados invalidados.")
+
 # --- Demonstrações do Módulo 2 ---
 
 def desafio_pacto_compacto():
@@ -421,7 +1066,7 @@ def desafio_cofre_rapido():
     # EXECUÇÃO E APRESENTAÇÃO (um teste para cada função de hash)
     for nome_funcao in ['multiplicacao', 'meio_quadrado']:
         print(f"\n=== Testando Cofre com Função de Hash: '{nome_funcao.upper()}' ===")
-        cofre = CofreRapido(tamanho=10, funcao_hash_nome=nome_funcao)
+        cofre = CofreRapido(tamanho=10, funcao_hash_nome=nome_funcao, usar_filtro=True)
         
         print("\n1. Inserindo Fragmentos no Cofre...")
         for chave, valor in fragmentos:
@@ -437,6 +1082,12 @@ def desafio_cofre_rapido():
             else:
                 print(f"  - Busca por '{chave}': FALHA! Fragmento não encontrado.")
 
+        # O Filtro de Bloom responde as buscas por chaves inexistentes sem tocar na tabela.
+        stats = cofre.estatisticas_filtro()
+        print(f"3. Filtro de Bloom: {stats['negativas_no_filtro']} de {stats['consultas']} buscas resolvidas no filtro, "
+              f"{stats['falsos_positivos']} falsos positivos, {stats['memoria_bytes']} bytes "
+              f"({stats['num_bits']} bits, {stats['num_hashes']} hashes).")
+
 # ==============================================================================
 # SEÇÃO 4: PONTO DE ENTRADA PRINCIPAL
 # ==============================================================================
@@ -454,7 +1105,11 @@ if __name__ == "__main__":
     print("\n" + "-"*70)
     desafio_2_busca_binaria()
     print("\n" + "-"*70)
+    desafio_2b_catalogo_mutavel()
+    print("\n" + "-"*70)
     desafio_3_rabin_karp()
+    print("\n" + "-"*70)
+    desafio_3b_cache_resultados()
 
     # Execução dos desafios do Módulo 2
     print("\n\n=============== MÓDULO 2: OTIMIZAÇÃO DE RECURSOS ===============")
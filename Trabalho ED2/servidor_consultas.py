@@ -0,0 +1,489 @@
+# ==============================================================================
+# PROJETO FORJA DE HERÓIS - SERVIDOR DE CONSULTAS DO ARQUIVISTA
+# ==============================================================================
+
+# Importações necessárias para o servidor e o gerador de carga
+import argparse  # Interpreta a linha de comando (modo servidor ou gerador de carga).
+import asyncio   # Laço de eventos que atende muitos clientes ao mesmo tempo em uma única thread.
+import json      # Protocolo: um objeto JSON por linha, tanto nos pedidos quanto nas respostas.
+import multiprocessing # Escolhe como os processos do pool são criados.
+import os        # Descobre o número de núcleos para dimensionar o pool de processos.
+import random    # Escolhe os pedidos aleatórios do gerador de carga.
+import time      # Mede latências e vazão no gerador de carga.
+from concurrent.futures import ProcessPoolExecutor # Executa as buscas de padrão pesadas fora do laço de eventos.
+
+from TrabFinal import (
+    BuscasComCache, CacheResultados, CatalogoOrdenado, CofreRapido, carregar_fragmentos_conhecimento,
+    carregar_tomos_antigos, gerar_catalogo_ordenado, rabin_karp,
+)
+
+# ==============================================================================
+# SEÇÃO 1: TRABALHO EXECUTADO NO POOL DE PROCESSOS
+# ==============================================================================
+
+# Cada processo do pool recebe os tomos uma única vez (no inicializador), para que
+# os pedidos enviem apenas o nome do tomo e o padrão, e não o texto inteiro.
+_TOMOS_DO_TRABALHADOR = {}
+
+def _inicializar_trabalhador(tomos):
+    """Guarda os tomos no processo trabalhador."""
+    _TOMOS_DO_TRABALHADOR.update(tomos)
+
+def _casar_lote(tarefas):
+    """
+    Executa um lote de buscas Rabin-Karp no processo trabalhador.
+    Cada tarefa é (nome_do_tomo, texto, padrao); quando o nome é informado, o texto é None.
+    """
+    return [rabin_karp(texto if texto is not None else _TOMOS_DO_TRABALHADOR[nome], padrao)
+            for nome, texto, padrao in tarefas]
+
+# ==============================================================================
+# SEÇÃO 2: SERVIDOR
+# ==============================================================================
+
+# Pedidos com textos grandes para o Rabin-Karp podem ultrapassar o limite padrão (64 KiB) do asyncio.
+LIMITE_LINHA = 2**24
+# Máximo de fragmentos por resposta de 'intervalo'/'prefixo': montar e serializar a resposta
+# acontece dentro do laço de eventos, então um limite alto travaria todos os outros clientes.
+LIMITE_RESULTADOS = 1000
+
+class ErroPedido(Exception):
+    """Pedido malformado ou com parâmetros inválidos; vira uma resposta de erro para o cliente."""
+
+class ServidorConsultas:
+    """
+    Servidor asyncio que carrega o catálogo, os tomos e o cofre UMA vez e atende
+    pedidos em JSON (um por linha) de muitos clientes.
+
+    Os pedidos que chegam no mesmo "tique" do laço de eventos são processados juntos:
+    consultas ao catálogo e ao cofre são respondidas na hora, e as buscas de padrão do
+    lote são agrupadas e, quando o volume de texto é grande, enviadas ao pool de processos.
+    """
+    def __init__(self, tamanho_catalogo=1000000, processos=None, limite_inline=20000, cache=None,
+                 limite_linha=LIMITE_LINHA, limite_resultados=LIMITE_RESULTADOS):
+        self.catalogo = CatalogoOrdenado(gerar_catalogo_ordenado(tamanho_catalogo))
+        self.tomos = carregar_tomos_antigos()
+        self.cofre = CofreRapido(tamanho=1024, funcao_hash_nome='multiplicacao', usar_filtro=True, verboso=False)
+        for chave, valor in carregar_fragmentos_conhecimento():
+            self.cofre.inserir(chave, valor)
+        # Resultados de Rabin-Karp se repetem muito; o cache evita até a ida ao pool.
+        # Os textos enviados pelos clientes também ficam no cache (versão memorizada), por isso
+        # há um limite em bytes além do limite em entradas.
+        self.cache = cache if cache is not None else CacheResultados(
+            max_entradas=4096, max_bytes=64 * 2**20, politica='lfu')
+        # Mesmas chaves e mesmo formato de resultado usados pelas buscas locais do TrabFinal.
+        self.buscas = BuscasComCache(self.catalogo, self.cache)
+        # Abaixo deste total de caracteres, o lote de buscas roda no próprio laço (enviar ao pool custaria mais).
+        self.limite_inline = limite_inline
+        self.limite_linha = limite_linha # Tamanho máximo de um pedido (uma linha), em bytes.
+        self.limite_resultados = limite_resultados
+        self.processos = processos or os.cpu_count() or 1
+        self._pool = None
+        self._pendentes = []
+        self._conexoes = set() # Tarefas que atendem os clientes conectados.
+        # Buscas de padrão já disparadas e ainda sem resultado: chave do cache -> (tarefa, futuros).
+        # Pedidos idênticos (no mesmo lote ou em lotes seguintes) aguardam o mesmo cálculo.
+        self._em_andamento = {}
+        self._lote_agendado = False
+        self.lotes, self.maior_lote, self.pedidos, self.lotes_no_pool = 0, 0, 0, 0
+
+    # --- Ciclo de vida ---
+
+    async def iniciar(self, host='127.0.0.1', porta=8765, caminho_unix=None):
+        """Abre o pool de processos e começa a escutar em TCP ou em um socket Unix."""
+        # 'spawn' em vez de 'fork': os processos são criados sob demanda, já com clientes conectados,
+        # e um fork herdaria os sockets desses clientes (o servidor nunca veria a desconexão deles).
+        self._pool = ProcessPoolExecutor(max_workers=self.processos, mp_context=multiprocessing.get_context('spawn'),
+                                         initializer=_inicializar_trabalhador, initargs=(self.tomos,))
+        if caminho_unix:
+            return await asyncio.start_unix_server(self._atender, path=caminho_unix, limit=self.limite_linha)
+        return await asyncio.start_server(self._atender, host, porta, limit=self.limite_linha)
+
+    async def aguardar_conexoes(self):
+        """Espera os clientes conectados se desconectarem (usado antes de encerrar)."""
+        await asyncio.gather(*self._conexoes, return_exceptions=True)
+
+    def encerrar(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    # --- Conexões ---
+
+    async def _atender(self, reader, writer):
+        """Lê pedidos de um cliente, linha a linha, e devolve as respostas assim que ficam prontas."""
+        tarefa = asyncio.current_task()
+        self._conexoes.add(tarefa)
+        try:
+            while True:
+                try:
+                    linha = await reader.readline()
+                except ValueError:
+                    # Linha maior que o limite: não há como ressincronizar o fluxo, então encerra.
+                    self._responder(writer, None, erro=f"Pedido maior que {self.limite_linha} bytes.")
+                    break
+                if not linha:
+                    break
+                if not linha.strip():
+                    continue
+                try:
+                    pedido = json.loads(linha)
+                    if not isinstance(pedido, dict):
+                        raise ErroPedido("O pedido deve ser um objeto JSON.")
+                except (ValueError, ErroPedido) as erro:
+                    self._responder(writer, None, erro=str(erro))
+                    continue
+                futuro = self._enfileirar(pedido)
+                futuro.add_done_callback(lambda f, p=pedido: self._responder_futuro(writer, p, f))
+                # Se o cliente não está lendo as respostas, para de ler novos pedidos (controle de fluxo).
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._conexoes.discard(tarefa)
+            writer.close()
+
+    def _responder_futuro(self, writer, pedido, futuro):
+        erro = futuro.exception()
+        if erro is None:
+            self._responder(writer, pedido.get('id'), resultado=futuro.result())
+        elif isinstance(erro, ErroPedido):
+            self._responder(writer, pedido.get('id'), erro=str(erro))
+        else:
+            self._responder(writer, pedido.get('id'), erro=f"Erro interno: {erro!r}")
+
+    @staticmethod
+    def _responder(writer, id_pedido, resultado=None, erro=None):
+        if writer.is_closing():
+            return # Cliente desconectou antes da resposta ficar pronta.
+        resposta = {'id': id_pedido, 'ok': erro is None}
+        if erro is None:
+            resposta['resultado'] = resultado
+        else:
+            resposta['erro'] = erro
+        writer.write(json.dumps(resposta, ensure_ascii=False).encode('utf-8') + b"\n")
+
+    # --- Lotes ---
+
+    def _enfileirar(self, pedido):
+        """Coloca o pedido no lote atual; o lote é processado no próximo tique do laço."""
+        laco = asyncio.get_running_loop()
+        futuro = laco.create_future()
+        self._pendentes.append((pedido, futuro))
+        if not self._lote_agendado:
+            self._lote_agendado = True
+            laco.call_soon(self._processar_lote)
+        return futuro
+
+    def _processar_lote(self):
+        lote, self._pendentes, self._lote_agendado = self._pendentes, [], False
+        self.lotes += 1
+        self.pedidos += len(lote)
+        self.maior_lote = max(self.maior_lote, len(lote))
+        # Buscas de padrão fora do cache deste lote (apenas as que ainda não estão em andamento).
+        novas = []
+        for pedido, futuro in lote:
+            try:
+                op = pedido.get('op')
+                if op == 'casar':
+                    chave, tarefa = self._preparar_casamento(pedido)
+                    resultado = self.cache.obter(chave)
+                    if resultado is not None:
+                        futuro.set_result(self._formatar_casamento(resultado))
+                    elif chave in self._em_andamento:
+                        # Mesma busca já calculada (neste lote ou no pool): só aguarda o resultado.
+                        self._em_andamento[chave][1].append(futuro)
+                    else:
+                        self._em_andamento[chave] = (tarefa, [futuro])
+                        novas.append(chave)
+                else:
+                    futuro.set_result(self._executar_imediato(op, pedido))
+            except Exception as erro:
+                # Qualquer falha fica restrita ao próprio pedido; os demais do lote seguem
+                # normalmente (uma exceção aqui sairia do callback e deixaria o lote sem resposta).
+                futuro.set_exception(erro)
+        if novas:
+            try:
+                self._executar_casamentos(novas)
+            except Exception as erro:
+                self._falhar_casamentos(novas, erro)
+
+    def _executar_casamentos(self, chaves):
+        """Roda as buscas de padrão do lote no laço (se forem leves) ou no pool de processos."""
+        tarefas = [self._em_andamento[chave][0] for chave in chaves]
+        volume = sum(len(texto if texto is not None else self.tomos[nome]) for nome, texto, _ in tarefas)
+        if volume < self.limite_inline or self._pool is None:
+            self._concluir_casamentos(chaves, _casar_lote_local(self.tomos, tarefas))
+            return
+        # Divide o lote em partes, uma por processo, para usar todos os núcleos.
+        self.lotes_no_pool += 1
+        num_partes = max(1, min(len(tarefas), self.processos))
+        laco = asyncio.get_running_loop()
+        for i in range(num_partes):
+            futuro_pool = laco.run_in_executor(self._pool, _casar_lote, tarefas[i::num_partes])
+            futuro_pool.add_done_callback(lambda f, parte=chaves[i::num_partes]: self._concluir_pool(parte, f))
+
+    def _concluir_pool(self, chaves, futuro_pool):
+        erro = futuro_pool.exception()
+        if erro is not None:
+            self._falhar_casamentos(chaves, erro)
+            return
+        self._concluir_casamentos(chaves, futuro_pool.result())
+
+    def _falhar_casamentos(self, chaves, erro):
+        """Repassa o erro a todos os pedidos que aguardavam essas buscas de padrão."""
+        for chave in chaves:
+            _, futuros = self._em_andamento.pop(chave, (None, []))
+            for futuro in futuros:
+                if not futuro.done():
+                    futuro.set_exception(erro)
+
+    def _concluir_casamentos(self, chaves, resultados):
+        for chave, resultado in zip(chaves, resultados):
+            resposta = self._formatar_casamento(self.buscas.guardar_rabin_karp(chave, resultado))
+            _, futuros = self._em_andamento.pop(chave, (None, []))
+            for futuro in futuros:
+                if not futuro.done():
+                    futuro.set_result(resposta)
+
+    # --- Operações ---
+
+    def _preparar_casamento(self, pedido):
+        """Valida um pedido 'casar' e monta a chave do cache e a tarefa para o Rabin-Karp."""
+        padrao = pedido.get('padrao')
+        if not isinstance(padrao, str) or not padrao:
+            raise ErroPedido("'casar' exige um 'padrao' não vazio.")
+        nome, texto = pedido.get('tomo'), pedido.get('texto')
+        if nome is not None:
+            if not isinstance(nome, str):
+                raise ErroPedido("O campo 'tomo' deve ser texto.")
+            if nome not in self.tomos:
+                raise ErroPedido(f"Tomo desconhecido: {nome!r}.")
+            return self.buscas.chave_rabin_karp(self.tomos[nome], padrao), (nome, None, padrao)
+        if not isinstance(texto, str):
+            raise ErroPedido("'casar' exige um 'tomo' ou um 'texto'.")
+        return self.buscas.chave_rabin_karp(texto, padrao), (None, texto, padrao)
+
+    @staticmethod
+    def _formatar_casamento(resultado):
+        ocorrencias, comp_hash, comp_char = resultado
+        return {'ocorrencias': list(ocorrencias), 'comparacoes_hash': comp_hash, 'comparacoes_caracteres': comp_char}
+
+    def _executar_imediato(self, op, pedido):
+        """Operações baratas, respondidas dentro do próprio lote."""
+        if op == 'buscar':
+            id_alvo = self._texto_obrigatorio(pedido, 'id_alvo')
+            indice, comparacoes = self.buscas.busca_binaria(id_alvo)
+            fragmento = self.catalogo.obter(id_alvo) if indice is not None else None
+            return {'indice': indice, 'comparacoes': comparacoes, 'fragmento': fragmento}
+        if op in ('intervalo', 'prefixo'):
+            limite = pedido.get('limite', min(100, self.limite_resultados))
+            if not isinstance(limite, int) or not 0 <= limite <= self.limite_resultados:
+                # Para mais resultados, o cliente pagina: pede de novo com 'inicio' após o último ID recebido.
+                raise ErroPedido(f"'limite' deve ser um inteiro entre 0 e {self.limite_resultados}.")
+            if op == 'intervalo':
+                fim = pedido.get('fim')
+                if fim is not None and not isinstance(fim, str):
+                    raise ErroPedido("O campo 'fim' deve ser texto ou null.")
+                gerador = self.catalogo.intervalo(self._texto_obrigatorio(pedido, 'inicio'), fim)
+            else:
+                gerador = self.catalogo.prefixo(self._texto_obrigatorio(pedido, 'prefixo'))
+            # O gerador é interrompido no limite: nunca percorre mais do que será devolvido.
+            return [fragmento for fragmento, _ in zip(gerador, range(limite))]
+        if op == 'obter':
+            return {'valor': self.cofre.buscar(self._texto_obrigatorio(pedido, 'chave'))}
+        if op == 'inserir':
+            chave = self._texto_obrigatorio(pedido, 'chave')
+            self.cofre.inserir(chave, pedido.get('valor'))
+            # Mantém as correntes curtas: dobra a tabela quando o fator de carga passa de 2.
+            if self.cofre.num_chaves > 2 * self.cofre.tamanho:
+                self.cofre.redimensionar(self.cofre.tamanho * 2)
+            return {'chaves': self.cofre.num_chaves}
+        if op == 'estatisticas':
+            return {
+                'pedidos': self.pedidos,
+                'lotes': self.lotes,
+                'maior_lote': self.maior_lote,
+                'lotes_no_pool': self.lotes_no_pool,
+                'cache': self.cache.estatisticas(),
+                'filtro_cofre': self.cofre.estatisticas_filtro(),
+            }
+        raise ErroPedido(f"Operação desconhecida: {op!r}.")
+
+    @staticmethod
+    def _texto_obrigatorio(pedido, campo):
+        valor = pedido.get(campo)
+        if not isinstance(valor, str):
+            raise ErroPedido(f"O campo '{campo}' é obrigatório e deve ser texto.")
+        return valor
+
+def _casar_lote_local(tomos, tarefas):
+    """Mesmo trabalho de _casar_lote, mas no processo do servidor (para lotes pequenos)."""
+    return [rabin_karp(texto if texto is not None else tomos[nome], padrao) for nome, texto, padrao in tarefas]
+
+# ==============================================================================
+# SEÇÃO 3: GERADOR DE CARGA
+# ==============================================================================
+
+def _pedido_aleatorio(tamanho_catalogo, tomos, texto_grande):
+    """Sorteia um pedido com uma mistura típica de consultas (concentradas em poucos IDs)."""
+    sorteio = random.random()
+    if sorteio < 0.5:
+        # Distribuição enviesada: a maioria das buscas cai em poucos IDs populares.
+        i = min(int(random.paretovariate(1.0)) - 1, tamanho_catalogo - 1)
+        return {'op': 'buscar', 'id_alvo': f"ID_{i:07}"}
+    if sorteio < 0.75:
+        pedido = {'op': 'casar', 'padrao': random.choice(["corrupção", "padrão", "Vazio", "marca"])}
+        if texto_grande and random.random() < 0.1:
+            pedido['texto'] = texto_grande # Busca pesada: força o uso do pool de processos.
+        else:
+            pedido['tomo'] = random.choice(tomos)
+        return pedido
+    if sorteio < 0.95:
+        # Em geral buscas por chaves inexistentes, como no desafio do cofre.
+        chave = random.choice(["FRG_100", "FRG_ABC"]) if random.random() < 0.2 else f"FRG_X{random.randrange(10**6)}"
+        return {'op': 'obter', 'chave': chave}
+    return {'op': 'inserir', 'chave': f"FRG_N{random.randrange(10**5)}", 'valor': "Novo conhecimento."}
+
+async def _cliente_de_carga(abrir_conexao, num_pedidos, profundidade, tamanho_catalogo, tomos, texto_grande, latencias):
+    """
+    Um cliente que mantém até 'profundidade' pedidos em voo (pipelining) e mede cada latência.
+    Se a conexão falhar, os pedidos ainda sem resposta contam como erros.
+    """
+    reader, writer = await abrir_conexao()
+    enviados_em = {}
+    respondidos, erros = 0, 0
+    janela = asyncio.Semaphore(profundidade)
+
+    async def enviar_pedidos():
+        for id_pedido in range(num_pedidos):
+            await janela.acquire()
+            pedido = _pedido_aleatorio(tamanho_catalogo, tomos, texto_grande)
+            pedido['id'] = id_pedido
+            enviados_em[id_pedido] = time.perf_counter()
+            writer.write(json.dumps(pedido, ensure_ascii=False).encode('utf-8') + b"\n")
+            await writer.drain()
+
+    async def ler_respostas():
+        nonlocal respondidos, erros
+        while respondidos < num_pedidos:
+            linha = await reader.readline()
+            if not linha:
+                raise ConnectionError("O servidor encerrou a conexão.")
+            resposta = json.loads(linha)
+            respondidos += 1
+            enviado_em = enviados_em.pop(resposta.get('id'), None)
+            if enviado_em is None:
+                # Resposta a um id que não foi enviado (ex.: 'id': null, quando o servidor
+                # não conseguiu ler o pedido): conta como erro, sem latência.
+                erros += 1
+            else:
+                latencias.append(time.perf_counter() - enviado_em)
+                erros += not resposta.get('ok')
+            janela.release()
+
+    tarefas = [asyncio.create_task(enviar_pedidos()), asyncio.create_task(ler_respostas())]
+    # Espera as duas pontas juntas: se uma falhar, a outra é cancelada (o envio, por exemplo,
+    # ficaria bloqueado para sempre na janela que o leitor não libera mais).
+    concluidas, _ = await asyncio.wait(tarefas, return_when=asyncio.FIRST_EXCEPTION)
+    falhas = [tarefa.exception() for tarefa in concluidas if tarefa.exception() is not None]
+    for tarefa in tarefas:
+        tarefa.cancel()
+    await asyncio.gather(*tarefas, return_exceptions=True)
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass # A conexão já tinha caído.
+    for falha in falhas:
+        if not isinstance(falha, (OSError, ValueError)):
+            raise falha # Erro do próprio gerador de carga, não da conexão.
+    if falhas:
+        erros += num_pedidos - respondidos
+    return erros
+
+def _percentil(valores_ordenados, p):
+    if not valores_ordenados:
+        return 0.0
+    return valores_ordenados[min(len(valores_ordenados) - 1, int(p / 100 * len(valores_ordenados)))]
+
+async def gerar_carga(abrir_conexao, clientes=50, pedidos_por_cliente=200, profundidade=8,
+                      tamanho_catalogo=1000000, tamanho_texto_grande=0):
+    """Dispara vários clientes concorrentes e retorna vazão e latências (em ms)."""
+    tomos = list(carregar_tomos_antigos())
+    texto_grande = None
+    if tamanho_texto_grande:
+        base = " ".join(carregar_tomos_antigos().values())
+        texto_grande = (base * (tamanho_texto_grande // len(base) + 1))[:tamanho_texto_grande]
+    latencias = []
+    inicio = time.perf_counter()
+    erros = await asyncio.gather(*(
+        _cliente_de_carga(abrir_conexao, pedidos_por_cliente, profundidade, tamanho_catalogo, tomos, texto_grande, latencias)
+        for _ in range(clientes)))
+    duracao = time.perf_counter() - inicio
+    latencias.sort()
+    return {
+        'pedidos': len(latencias),
+        'erros': sum(erros),
+        'duracao_s': duracao,
+        'vazao_pedidos_s': len(latencias) / duracao if duracao else 0.0,
+        'latencia_p50_ms': _percentil(latencias, 50) * 1000,
+        'latencia_p99_ms': _percentil(latencias, 99) * 1000,
+        'latencia_max_ms': (latencias[-1] if latencias else 0.0) * 1000,
+    }
+
+# ==============================================================================
+# SEÇÃO 4: PONTO DE ENTRADA PRINCIPAL
+# ==============================================================================
+
+def _abridor_de_conexao(args):
+    if args.unix:
+        return lambda: asyncio.open_unix_connection(args.unix, limit=LIMITE_LINHA)
+    return lambda: asyncio.open_connection(args.host, args.porta, limit=LIMITE_LINHA)
+
+async def _principal(args):
+    if args.modo == 'servidor' or args.embutido:
+        print(f"Carregando catálogo com {args.tamanho_catalogo} registros, tomos e cofre...")
+        servidor = ServidorConsultas(tamanho_catalogo=args.tamanho_catalogo, processos=args.processos)
+        socket_servidor = await servidor.iniciar(args.host, args.porta, args.unix)
+        print(f"Servidor escutando em {args.unix or f'{args.host}:{args.porta}'}.")
+        if args.modo == 'servidor':
+            try:
+                async with socket_servidor:
+                    await socket_servidor.serve_forever()
+            finally:
+                servidor.encerrar()
+            return
+
+    resultado = await gerar_carga(_abridor_de_conexao(args), args.clientes, args.pedidos, args.profundidade,
+                                  args.tamanho_catalogo, args.texto_grande)
+    print(f"\n{resultado['pedidos']} pedidos ({resultado['erros']} erros) em {resultado['duracao_s']:.2f} s")
+    print(f"Vazão: {resultado['vazao_pedidos_s']:.0f} pedidos/s")
+    print(f"Latência p50: {resultado['latencia_p50_ms']:.2f} ms | p99: {resultado['latencia_p99_ms']:.2f} ms | "
+          f"máx: {resultado['latencia_max_ms']:.2f} ms")
+    if args.embutido:
+        print(f"Estatísticas do servidor: {servidor._executar_imediato('estatisticas', {})}")
+        socket_servidor.close()
+        await servidor.aguardar_conexoes()
+        await socket_servidor.wait_closed()
+        servidor.encerrar()
+
+# O servidor e o gerador de carga usam o mesmo script:
+#   python servidor_consultas.py servidor --porta 8765
+#   python servidor_consultas.py carga --porta 8765 --clientes 50 --pedidos 200
+#   python servidor_consultas.py carga --embutido      (sobe um servidor no próprio processo)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor de consultas do Arquivista e gerador de carga.")
+    parser.add_argument('modo', choices=['servidor', 'carga'])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8765)
+    parser.add_argument('--unix', help="Caminho de um socket Unix (substitui host/porta).")
+    parser.add_argument('--tamanho-catalogo', type=int, default=1000000)
+    parser.add_argument('--processos', type=int, default=None, help="Processos do pool (padrão: número de núcleos).")
+    parser.add_argument('--clientes', type=int, default=50)
+    parser.add_argument('--pedidos', type=int, default=200, help="Pedidos por cliente.")
+    parser.add_argument('--profundidade', type=int, default=8, help="Pedidos em voo por cliente.")
+    parser.add_argument('--texto-grande', type=int, default=0,
+                        help="Tamanho (caracteres) de um texto enviado em 10%% das buscas de padrão.")
+    parser.add_argument('--embutido', action='store_true', help="No modo carga, sobe o servidor no mesmo processo.")
+    asyncio.run(_principal(parser.parse_args()))